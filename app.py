@@ -3,6 +3,8 @@ import sqlite3
 import os
 import re
 import json
+import hashlib
+import tempfile
 import bcrypt
 import random
 import string
@@ -11,6 +13,13 @@ from email.message import EmailMessage
 import threading
 import time
 import requests
+import csv
+import io
+from urllib.parse import urlencode
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 app = Flask(__name__)
 
@@ -52,10 +61,137 @@ def list_translations():
         })
     return Response(json.dumps({"translations": translations}, ensure_ascii=False), mimetype='application/json')
 
+def get_bible_db_path(translation):
+    db_folder = os.path.join(os.path.dirname(__file__), 'db', 'bibles')
+    return os.path.join(db_folder, f"{translation}.SQLite3")
+
+def get_bible_language(cursor):
+    cursor.execute("SELECT value FROM info WHERE name='language' LIMIT 1")
+    row = cursor.fetchone()
+    if row and row[0]:
+        return row[0]
+    return None
+
+# Shared SELECT fragments so every endpoint formats references the same way
+VERSE_REFERENCE_SQL = "books.long_name || ' ' || verses.chapter || ':' || verses.verse"
+VERSE_BOOKS_JOIN = "JOIN books ON verses.book_number = books.book_number"
+
+def verse_record(translation, language, reference, verse):
+    return {
+        "Translation": translation,
+        "Reference": reference,
+        "Verse": verse,
+        "Language": language
+    }
+
+def clean_verse_text(verse_text):
+    if verse_text is None:
+        verse_text = ''
+    # Remove <S> tags with Strong's numbers
+    verse_text = re.sub(r'<S>[\d\s,]+<\/S>', '', verse_text)
+    # Remove <p ...> tags (including <p> and <p ...>)
+    verse_text = re.sub(r'<p[^>]*>', '', verse_text, flags=re.IGNORECASE)
+    verse_text = re.sub(r'</p>', '', verse_text, flags=re.IGNORECASE)
+    verse_text = re.sub(r'<p[^\s>]*?', '', verse_text, flags=re.IGNORECASE)
+    # Remove <pb/> tags
+    verse_text = re.sub(r'<pb\s*\/>', '', verse_text, flags=re.IGNORECASE)
+    # Remove <i> and </i> tags (including <i ...>)
+    verse_text = re.sub(r'</?i[^>]*>', '', verse_text, flags=re.IGNORECASE)
+    # Remove custom footnote tags like <f>[7†]</f>
+    verse_text = re.sub(r'<f>.*?<\/f>', '', verse_text, flags=re.IGNORECASE)
+    # Remove any remaining HTML tags
+    verse_text = re.sub(r'<[^>]+>', '', verse_text)
+    # Remove leftover raw footnote markers like [7], [8], [10a], [ 11 ]
+    verse_text = re.sub(r'\[\s*\d+[a-zA-Z]?†?\s*\]', '', verse_text)
+    # Remove unwanted symbols but keep punctuation and letters
+    verse_text = re.sub(r'[^\w\s.,;:\'\"!?()\-\–—\[\]{}<>\/]', '', verse_text)
+    # Collapse excess whitespace
+    verse_text = re.sub(r'\s{2,}', ' ', verse_text)
+    return verse_text.strip()
+
+# Wire formats for verse lists; JSON stays the default when nothing else is asked for
+VERSE_FORMATS = {
+    'json': 'application/json',
+    'columns': 'application/vnd.bibleapi.columns+json',
+    'ndjson': 'application/x-ndjson',
+    'msgpack': 'application/msgpack',
+    'csv': 'text/csv'
+}
+
+def negotiate_verse_format():
+    requested = request.args.get('format')
+    if requested:
+        return requested.lower()
+    accepted = request.accept_mimetypes.best_match(list(VERSE_FORMATS.values()) + ['application/x-msgpack'])
+    if accepted == 'application/x-msgpack':
+        return 'msgpack'
+    for name, mimetype in VERSE_FORMATS.items():
+        if mimetype == accepted:
+            return name
+    return 'json'
+
+def verses_response(translation, language, rows, extra=None):
+    """Serialize (Reference, Verse) rows in the format the client negotiated."""
+    extra = extra or {}
+    fmt = negotiate_verse_format()
+    if fmt not in VERSE_FORMATS:
+        return jsonify(error=f"Unsupported format: {fmt}. Use one of: {', '.join(VERSE_FORMATS)}"), 406
+    # The compact formats carry Translation and Language themselves, so skip extra copies
+    compact_extra = {key: value for key, value in extra.items() if key.lower() not in ('translation', 'language')}
+    if fmt == 'json':
+        body = json.dumps(dict(extra, verses=[
+            verse_record(translation, language, reference, verse) for reference, verse in rows
+        ]), ensure_ascii=False)
+        response = Response(body, mimetype=VERSE_FORMATS[fmt])
+    elif fmt in ('columns', 'msgpack'):
+        # Per-translation constants are sent once, verse fields as parallel arrays
+        document = dict(compact_extra, Translation=translation, Language=language, verses={
+            "Reference": [reference for reference, verse in rows],
+            "Verse": [verse for reference, verse in rows]
+        })
+        if fmt == 'columns':
+            response = Response(json.dumps(document, ensure_ascii=False), mimetype=VERSE_FORMATS[fmt])
+        elif msgpack is None:
+            return jsonify(error="MessagePack output requires the 'msgpack' package"), 406
+        else:
+            response = Response(msgpack.packb(document, use_bin_type=True), mimetype=VERSE_FORMATS[fmt])
+    elif fmt == 'ndjson':
+        # First line carries the constants, then one compact object per verse
+        def generate():
+            yield json.dumps(dict(compact_extra, Translation=translation, Language=language), ensure_ascii=False) + '\n'
+            for reference, verse in rows:
+                yield json.dumps({"Reference": reference, "Verse": verse}, ensure_ascii=False) + '\n'
+        response = Response(generate(), mimetype=VERSE_FORMATS[fmt])
+    else:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["Reference", "Verse"])
+        writer.writerows(rows)
+        response = Response(buffer.getvalue(), mimetype=VERSE_FORMATS[fmt])
+        # CSV has no room for metadata, so the constants and extra fields travel as headers
+        response.headers['X-Translation'] = translation
+        for key, value in compact_extra.items():
+            response.headers['X-' + key.replace('_', '-').title()] = str(value)
+        if all(key in extra for key in ('total', 'page', 'per_page')):
+            response.headers['X-Total-Count'] = str(extra['total'])
+            links = []
+            if extra['page'] > 1:
+                links.append((extra['page'] - 1, 'prev'))
+            if extra['page'] * extra['per_page'] < extra['total']:
+                links.append((extra['page'] + 1, 'next'))
+            if links:
+                response.headers['Link'] = ', '.join(
+                    f"<{request.base_url}?{urlencode(dict(request.args.to_dict(), page=page))}>; rel=\"{rel}\""
+                    for page, rel in links
+                )
+    if language:
+        response.headers['Content-Language'] = language
+    response.headers['Vary'] = 'Accept'
+    return response
+
 @app.route('/api/verses/<translation>')
 def load_data(translation):
-    db_folder = os.path.join(os.path.dirname(__file__), 'db', 'bibles')
-    db_path = os.path.join(db_folder, f"{translation}.SQLite3")
+    db_path = get_bible_db_path(translation)
     print(f"Requested translation: {translation}")
     print(f"Database path: {db_path}")
     if not os.path.exists(db_path):
@@ -65,18 +201,15 @@ def load_data(translation):
     try:
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
-        cursor.execute("SELECT value FROM info WHERE name='language' LIMIT 1")
-        row = cursor.fetchone()
-        if row and row[0]:
-            language = row[0]
+        language = get_bible_language(cursor)
         # Query verses
-        query = """
+        query = f"""
             SELECT
                 ? AS Translation,
-                books.long_name || ' ' || verses.chapter || ':' || verses.verse AS Reference,
+                {VERSE_REFERENCE_SQL} AS Reference,
                 verses.text AS Verse
             FROM verses
-            JOIN books ON verses.book_number = books.book_number
+            {VERSE_BOOKS_JOIN}
             ORDER BY verses.book_number, verses.chapter, verses.verse
         """
         cursor.execute(query, (translation,))
@@ -85,39 +218,485 @@ def load_data(translation):
     except Exception as e:
         print(f"Exception opening or querying database: {e}")
         return jsonify(error=str(e)), 500
-    cleaned_rows = []
-    for row in rows:
-        verse_text = row[2]
-        if verse_text is None:
-            verse_text = ''
-        # Remove <S> tags with Strong's numbers
-        verse_text = re.sub(r'<S>[\d\s,]+<\/S>', '', verse_text)
-        # Remove <p ...> tags (including <p> and <p ...>)
-        verse_text = re.sub(r'<p[^>]*>', '', verse_text, flags=re.IGNORECASE)
-        verse_text = re.sub(r'</p>', '', verse_text, flags=re.IGNORECASE)
-        verse_text = re.sub(r'<p[^\s>]*?', '', verse_text, flags=re.IGNORECASE)
-        # Remove <pb/> tags
-        verse_text = re.sub(r'<pb\s*\/>', '', verse_text, flags=re.IGNORECASE)
-        # Remove <i> and </i> tags (including <i ...>)
-        verse_text = re.sub(r'</?i[^>]*>', '', verse_text, flags=re.IGNORECASE)
-        # Remove custom footnote tags like <f>[7†]</f>
-        verse_text = re.sub(r'<f>.*?<\/f>', '', verse_text, flags=re.IGNORECASE)
-        # Remove any remaining HTML tags
-        verse_text = re.sub(r'<[^>]+>', '', verse_text)
-        # Remove leftover raw footnote markers like [7], [8], [10a], [ 11 ]
-        verse_text = re.sub(r'\[\s*\d+[a-zA-Z]?†?\s*\]', '', verse_text)
-        # Remove unwanted symbols but keep punctuation and letters
-        verse_text = re.sub(r'[^\w\s.,;:\'\"!?()\-\–—\[\]{}<>\/]', '', verse_text)
-        # Collapse excess whitespace
-        verse_text = re.sub(r'\s{2,}', ' ', verse_text)
-        cleaned_rows.append({
-            "Translation": row[0],
-            "Reference": row[1],
-            "Verse": verse_text.strip(),
-            "Language": language
-        })
-    # Return JSON with ensure_ascii=False for Unicode
-    return Response(json.dumps({"verses": cleaned_rows}, ensure_ascii=False), mimetype='application/json')
+    cleaned_rows = [(row[1], clean_verse_text(row[2])) for row in rows]
+    return verses_response(translation, language, cleaned_rows)
+
+# MyBible book numbering: Old Testament books are numbered below 470 (Matthew)
+NEW_TESTAMENT_FIRST_BOOK = 470
+
+# Per-translation verse index, rebuilt whenever the database file's mtime changes
+verse_index_cache = {}
+verse_index_lock = threading.Lock()
+
+def get_verse_index(translation, db_path):
+    mtime = os.path.getmtime(db_path)
+    with verse_index_lock:
+        index = verse_index_cache.get(translation)
+        if index and index["mtime"] == mtime:
+            return index
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    language = get_bible_language(cursor)
+    book_names = {}
+    cursor.execute("SELECT book_number, short_name, long_name FROM books")
+    for book_number, short_name, long_name in cursor.fetchall():
+        book_names[str(book_number)] = book_number
+        for name in (short_name, long_name):
+            if name:
+                book_names[name.strip().lower()] = book_number
+    # Row positions in canonical order; each book and testament is a contiguous slice
+    cursor.execute("SELECT rowid, book_number FROM verses ORDER BY book_number, chapter, verse")
+    rowids = []
+    book_ranges = {}
+    nt_start = None
+    for rowid, book_number in cursor.fetchall():
+        position = len(rowids)
+        rowids.append(rowid)
+        if book_number in book_ranges:
+            book_ranges[book_number][1] = position + 1
+        else:
+            book_ranges[book_number] = [position, position + 1]
+        if nt_start is None and book_number >= NEW_TESTAMENT_FIRST_BOOK:
+            nt_start = position
+    conn.close()
+    if nt_start is None:
+        nt_start = len(rowids)
+    index = {
+        "mtime": mtime,
+        "language": language,
+        "rowids": rowids,
+        "book_names": book_names,
+        "book_ranges": book_ranges,
+        "testament_ranges": {"ot": (0, nt_start), "nt": (nt_start, len(rowids))}
+    }
+    with verse_index_lock:
+        verse_index_cache[translation] = index
+    return index
+
+def get_verse_range(index, book, testament):
+    start, end = 0, len(index["rowids"])
+    if testament:
+        testament_range = index["testament_ranges"].get(testament.lower())
+        if testament_range is None:
+            raise ValueError("Testament must be 'ot' or 'nt'")
+        start, end = testament_range
+    if book:
+        book_number = index["book_names"].get(book.strip().lower())
+        if book_number is None or book_number not in index["book_ranges"]:
+            raise ValueError(f"Book not found: {book}")
+        book_start, book_end = index["book_ranges"][book_number]
+        start, end = max(start, book_start), min(end, book_end)
+    if start >= end:
+        raise ValueError("No verses match the given filters")
+    return start, end
+
+def fetch_verse_by_rowid(db_path, translation, language, rowid):
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute(f"""
+        SELECT
+            {VERSE_REFERENCE_SQL} AS Reference,
+            verses.text AS Verse
+        FROM verses
+        {VERSE_BOOKS_JOIN}
+        WHERE verses.rowid = ?
+    """, (rowid,))
+    row = cursor.fetchone()
+    conn.close()
+    return verse_record(translation, language, row[0], clean_verse_text(row[1]))
+
+def pick_verse(translation, seed=None):
+    db_path = get_bible_db_path(translation)
+    if not os.path.exists(db_path):
+        return jsonify(error=f"Database file not found: {db_path}"), 404
+    try:
+        index = get_verse_index(translation, db_path)
+        start, end = get_verse_range(index, request.args.get('book'), request.args.get('testament'))
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+    except Exception as e:
+        print(f"Exception building verse index: {e}")
+        return jsonify(error=str(e)), 500
+    # Seed from the resolved range so equivalent filters (NT/nt, Gen/Genesis) agree
+    rng = random.SystemRandom() if seed is None else random.Random(f"{seed}:{start}:{end}")
+    rowid = index["rowids"][rng.randrange(start, end)]
+    try:
+        verse = fetch_verse_by_rowid(db_path, translation, index["language"], rowid)
+    except Exception as e:
+        print(f"Exception opening or querying database: {e}")
+        return jsonify(error=str(e)), 500
+    return Response(json.dumps({"verse": verse}, ensure_ascii=False), mimetype='application/json')
+
+@app.route('/api/verses/<translation>/random')
+def random_verse(translation):
+    response = pick_verse(translation)
+    if isinstance(response, Response):
+        response.headers['Cache-Control'] = 'no-store'
+    return response
+
+@app.route('/api/verses/<translation>/daily')
+def daily_verse(translation):
+    import datetime
+    date_param = request.args.get('date')
+    try:
+        day = datetime.date.fromisoformat(date_param) if date_param else datetime.date.today()
+    except ValueError:
+        return jsonify(error="Date must be in YYYY-MM-DD format"), 400
+    # Seeding with the date keeps the pick stable across requests and workers
+    response = pick_verse(translation, seed=f"{translation}:{day.isoformat()}")
+    if isinstance(response, Response):
+        now = datetime.datetime.now()
+        midnight = datetime.datetime.combine(now.date() + datetime.timedelta(days=1), datetime.time())
+        response.headers['Cache-Control'] = f"public, max-age={int((midnight - now).total_seconds())}"
+    return response
+
+# Per-translation content hashes, rebuilt whenever the database file's mtime changes
+manifest_cache = {}
+manifest_lock = threading.Lock()
+
+def chapter_key(book_number, chapter):
+    return f"{int(book_number)}:{int(chapter)}"
+
+def get_manifest(translation, db_path):
+    mtime = os.path.getmtime(db_path)
+    with manifest_lock:
+        manifest = manifest_cache.get(translation)
+        if manifest and manifest["mtime"] == mtime:
+            return manifest
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute(f"""
+        SELECT
+            verses.book_number,
+            verses.chapter,
+            {VERSE_REFERENCE_SQL} AS Reference,
+            verses.text AS Verse
+        FROM verses
+        {VERSE_BOOKS_JOIN}
+        ORDER BY verses.book_number, verses.chapter, verses.verse
+    """)
+    # Hash the cleaned text so the manifest tracks what clients actually store
+    chapters = {}
+    translation_hash = hashlib.sha256()
+    current_key = None
+    chapter_hash = None
+    for book_number, chapter, reference, verse_text in cursor:
+        key = chapter_key(book_number, chapter)
+        if key != current_key:
+            if current_key is not None:
+                chapters[current_key] = chapter_hash.hexdigest()[:16]
+                translation_hash.update(f"{current_key}={chapters[current_key]}\n".encode('utf-8'))
+            current_key = key
+            chapter_hash = hashlib.sha256()
+        chapter_hash.update(f"{reference}\t{clean_verse_text(verse_text)}\n".encode('utf-8'))
+    if current_key is not None:
+        chapters[current_key] = chapter_hash.hexdigest()[:16]
+        translation_hash.update(f"{current_key}={chapters[current_key]}\n".encode('utf-8'))
+    conn.close()
+    manifest = {
+        "mtime": mtime,
+        "hash": translation_hash.hexdigest()[:16],
+        "chapters": chapters
+    }
+    with manifest_lock:
+        manifest_cache[translation] = manifest
+    return manifest
+
+@app.route('/api/verses/<translation>/manifest')
+def verses_manifest(translation):
+    db_path = get_bible_db_path(translation)
+    if not os.path.exists(db_path):
+        return jsonify(error=f"Database file not found: {db_path}"), 404
+    try:
+        manifest = get_manifest(translation, db_path)
+    except Exception as e:
+        print(f"Exception building manifest: {e}")
+        return jsonify(error=str(e)), 500
+    response = Response(json.dumps({
+        "translation": translation,
+        "hash": manifest["hash"],
+        "chapters": manifest["chapters"]
+    }, ensure_ascii=False), mimetype='application/json')
+    response.set_etag(manifest["hash"])
+    return response.make_conditional(request)
+
+@app.route('/api/verses/<translation>/delta', methods=['POST'])
+def verses_delta(translation):
+    db_path = get_bible_db_path(translation)
+    if not os.path.exists(db_path):
+        return jsonify(error=f"Database file not found: {db_path}"), 404
+    # Only a truly empty body means "client has nothing"; anything unparsable is an error
+    body = request.get_data(as_text=True)
+    try:
+        data = json.loads(body) if body.strip() else {}
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        return jsonify(error="Request body must be a JSON object"), 400
+    client_chapters = data.get('chapters') or {}
+    if not isinstance(client_chapters, dict):
+        return jsonify(error="'chapters' must map 'book_number:chapter' keys to hashes"), 400
+    try:
+        manifest = get_manifest(translation, db_path)
+    except Exception as e:
+        print(f"Exception building manifest: {e}")
+        return jsonify(error=str(e)), 500
+    server_chapters = manifest["chapters"]
+    changed = [key for key, chapter_hash in server_chapters.items() if client_chapters.get(key) != chapter_hash]
+    removed = [key for key in client_chapters if key not in server_chapters]
+    verses_by_chapter = {key: [] for key in changed}
+    language = None
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        language = get_bible_language(cursor)
+        # Fetch changed chapters in batches to stay under SQLite's bound-parameter limit
+        batch_size = 400
+        for i in range(0, len(changed), batch_size):
+            batch = changed[i:i + batch_size]
+            params = []
+            for key in batch:
+                params.extend(int(part) for part in key.split(':'))
+            cursor.execute(f"""
+                SELECT
+                    verses.book_number,
+                    verses.chapter,
+                    {VERSE_REFERENCE_SQL} AS Reference,
+                    verses.text AS Verse
+                FROM verses
+                {VERSE_BOOKS_JOIN}
+                WHERE (verses.book_number, verses.chapter) IN (VALUES {', '.join(['(?, ?)'] * len(batch))})
+                ORDER BY verses.book_number, verses.chapter, verses.verse
+            """, params)
+            for book_number, chapter, reference, verse_text in cursor.fetchall():
+                verses_by_chapter[chapter_key(book_number, chapter)].append(
+                    verse_record(translation, language, reference, clean_verse_text(verse_text))
+                )
+        conn.close()
+    except Exception as e:
+        print(f"Exception opening or querying database: {e}")
+        return jsonify(error=str(e)), 500
+    return Response(json.dumps({
+        "translation": translation,
+        "hash": manifest["hash"],
+        "changed": [{
+            "chapter": key,
+            "hash": server_chapters[key],
+            "verses": verses_by_chapter[key]
+        } for key in changed],
+        "removed": removed
+    }, ensure_ascii=False), mimetype='application/json')
+
+# Strong's number -> verse rowids, persisted next to the database as a sidecar file
+strongs_cache = {}
+strongs_lock = threading.Lock()
+
+def normalize_strongs_number(number):
+    match = re.fullmatch(r'\s*([GHgh])0*(\d+)\s*', number or '')
+    if not match:
+        return None
+    return f"{match.group(1).upper()}{match.group(2)}"
+
+def build_strongs_index(db_path):
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute("SELECT rowid, book_number, text FROM verses ORDER BY book_number, chapter, verse")
+    index = {}
+    for rowid, book_number, verse_text in cursor:
+        # MyBible tags carry bare numbers; the testament tells Hebrew from Greek
+        prefix = 'G' if book_number >= NEW_TESTAMENT_FIRST_BOOK else 'H'
+        for tag in re.findall(r'<S>([\d\s,]+)<\/S>', verse_text or ''):
+            for number in re.findall(r'\d+', tag):
+                rowids = index.setdefault(f"{prefix}{int(number)}", [])
+                if not rowids or rowids[-1] != rowid:
+                    rowids.append(rowid)
+    conn.close()
+    return index
+
+def get_strongs_index(translation, db_path):
+    stat = os.stat(db_path)
+    with strongs_lock:
+        cached = strongs_cache.get(translation)
+        if cached and cached["source_mtime"] == stat.st_mtime and cached["source_size"] == stat.st_size:
+            return cached["index"]
+    sidecar_path = os.path.join(os.path.dirname(db_path), f"{translation}.strongs.json")
+    sidecar = None
+    if os.path.exists(sidecar_path):
+        try:
+            with open(sidecar_path, encoding='utf-8') as f:
+                sidecar = json.load(f)
+        except Exception as e:
+            print(f"Could not read Strong's sidecar {sidecar_path}: {e}")
+    if not sidecar or sidecar.get("source_mtime") != stat.st_mtime or sidecar.get("source_size") != stat.st_size:
+        print(f"Building Strong's index for {translation}")
+        sidecar = {
+            "source_mtime": stat.st_mtime,
+            "source_size": stat.st_size,
+            "index": build_strongs_index(db_path)
+        }
+        tmp_path = None
+        try:
+            # Each writer gets its own temp file, so concurrent readers never see a partial sidecar
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(sidecar_path), prefix=f"{translation}.strongs.", suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(sidecar, f, separators=(',', ':'))
+            os.replace(tmp_path, sidecar_path)
+        except Exception as e:
+            print(f"Could not write Strong's sidecar {sidecar_path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    with strongs_lock:
+        strongs_cache[translation] = sidecar
+    return sidecar["index"]
+
+@app.route('/api/strongs/<translation>/<number>')
+def strongs_lookup(translation, number):
+    db_path = get_bible_db_path(translation)
+    if not os.path.exists(db_path):
+        return jsonify(error=f"Database file not found: {db_path}"), 404
+    strongs_number = normalize_strongs_number(number)
+    if not strongs_number:
+        return jsonify(error="Strong's number must look like G26 or H430"), 400
+    try:
+        page = max(int(request.args.get('page', 1)), 1)
+        per_page = min(max(int(request.args.get('per_page', 50)), 1), 500)
+    except ValueError:
+        return jsonify(error="'page' and 'per_page' must be integers"), 400
+    try:
+        rowids = get_strongs_index(translation, db_path).get(strongs_number, [])
+        page_rowids = rowids[(page - 1) * per_page:page * per_page]
+        verses = []
+        # Read from the cached verse index so empty pages still report the language
+        language = get_verse_index(translation, db_path)["language"]
+        if page_rowids:
+            conn = sqlite3.connect(db_path)
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT
+                    verses.rowid,
+                    {VERSE_REFERENCE_SQL} AS Reference,
+                    verses.text AS Verse
+                FROM verses
+                {VERSE_BOOKS_JOIN}
+                WHERE verses.rowid IN ({', '.join(['?'] * len(page_rowids))})
+            """, page_rowids)
+            rows = {row[0]: row for row in cursor.fetchall()}
+            conn.close()
+            verses = [(rows[rowid][1], clean_verse_text(rows[rowid][2])) for rowid in page_rowids if rowid in rows]
+    except Exception as e:
+        print(f"Exception opening or querying database: {e}")
+        return jsonify(error=str(e)), 500
+    return verses_response(translation, language, verses, {
+        "translation": translation,
+        "strongs": strongs_number,
+        "total": len(rowids),
+        "page": page,
+        "per_page": per_page
+    })
+
+# Keeps each translation's VALUES list well under SQLite's bound-parameter limit
+MAX_BATCH_PASSAGES = 100
+
+def parse_passage(item):
+    if not isinstance(item, dict):
+        raise ValueError("Passage must be an object")
+    translation = item.get('translation')
+    book = item.get('book')
+    if not translation or book in (None, ''):
+        raise ValueError("Passage requires 'translation' and 'book'")
+    # The body, unlike a URL segment, could otherwise point outside db/bibles
+    if not isinstance(translation, str) or '/' in translation or '\\' in translation or '..' in translation:
+        raise ValueError(f"Invalid translation: {translation}")
+    try:
+        chapter = int(item.get('chapter'))
+        verse_start = item.get('verse_start', item.get('verse'))
+        verse_end = item.get('verse_end', verse_start)
+        # A passage without verses covers the whole chapter
+        verse_start = int(verse_start) if verse_start is not None else 1
+        verse_end = int(verse_end) if verse_end is not None else None
+    except (TypeError, ValueError):
+        raise ValueError("'chapter', 'verse_start' and 'verse_end' must be integers")
+    if verse_end is not None and verse_end < verse_start:
+        raise ValueError("'verse_end' must not be before 'verse_start'")
+    return translation, str(book).strip().lower(), chapter, verse_start, verse_end
+
+def resolve_passages(translation, items, results):
+    """Resolve one translation's (position, book, chapter, start, end) items into results."""
+    db_path = get_bible_db_path(translation)
+    if not os.path.exists(db_path):
+        for position, *_ in items:
+            results[position] = {"error": f"Translation not found: {translation}"}
+        return
+    # Book names and language come from the cached verse index so lookups match it exactly
+    index = get_verse_index(translation, db_path)
+    book_names = index["book_names"]
+    language = index["language"]
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.cursor()
+        params = []
+        for position, book, chapter, verse_start, verse_end in items:
+            if book not in book_names:
+                results[position] = {"error": f"Book not found: {book}"}
+                continue
+            params.extend((position, book_names[book], chapter, verse_start, verse_end))
+        if not params:
+            return
+        verses_by_position = {}
+        cursor.execute(f"""
+            WITH requested(position, book_number, chapter, verse_start, verse_end) AS (
+                VALUES {', '.join(['(?, ?, ?, ?, ?)'] * (len(params) // 5))}
+            )
+            SELECT
+                requested.position,
+                {VERSE_REFERENCE_SQL} AS Reference,
+                verses.text AS Verse
+            FROM requested
+            JOIN verses ON verses.book_number = requested.book_number
+                AND verses.chapter = requested.chapter
+                AND verses.verse >= requested.verse_start
+                AND (requested.verse_end IS NULL OR verses.verse <= requested.verse_end)
+            {VERSE_BOOKS_JOIN}
+            ORDER BY requested.position, verses.verse
+        """, params)
+        for position, reference, verse_text in cursor.fetchall():
+            verses_by_position.setdefault(position, []).append(
+                verse_record(translation, language, reference, clean_verse_text(verse_text))
+            )
+        for position in params[::5]:
+            if position in verses_by_position:
+                results[position] = {"verses": verses_by_position[position]}
+            else:
+                results[position] = {"error": "Passage not found"}
+    finally:
+        conn.close()
+
+@app.route('/api/passages', methods=['POST'])
+def batch_passages():
+    data = request.get_json(silent=True) or {}
+    passages = data.get('passages') if isinstance(data, dict) else None
+    if not isinstance(passages, list) or not passages:
+        return jsonify(error="'passages' must be a non-empty list"), 400
+    if len(passages) > MAX_BATCH_PASSAGES:
+        return jsonify(error=f"At most {MAX_BATCH_PASSAGES} passages per request"), 400
+    results = [None] * len(passages)
+    groups = {}
+    for position, item in enumerate(passages):
+        try:
+            translation, book, chapter, verse_start, verse_end = parse_passage(item)
+        except ValueError as e:
+            results[position] = {"error": str(e)}
+            continue
+        groups.setdefault(translation, []).append((position, book, chapter, verse_start, verse_end))
+    for translation, items in groups.items():
+        try:
+            resolve_passages(translation, items, results)
+        except Exception as e:
+            print(f"Exception opening or querying database: {e}")
+            for position, *_ in items:
+                if results[position] is None:
+                    results[position] = {"error": str(e)}
+    return Response(json.dumps({"passages": results}, ensure_ascii=False), mimetype='application/json')
 
 def get_users(cursor):
     cursor.execute("SELECT id, firstname, lastname, username, email, orgname, mobile, isEmailVerified, isRegistered, created, updated FROM Users")